@@ -3,21 +3,70 @@
 
 他プロジェクトに埋め込み可能。テンプレート・出力先はすべて引数で指定する。
 ダミーデータ生成は含まない。
+
+テンプレートは {{NAME}} 形式のプレースホルダ置換のみに対応する。初回に一度だけ分割（コンパイル）して
+キャッシュし、以降は1パスで出力するため、Jinja2 等のテンプレートエンジンには依存しない。
 """
+import functools
+import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import uuid
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from html import escape as _esc
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 import cv2
 import numpy as np
 
 
+_log = logging.getLogger(__name__)
+
+# テンプレート中のプレースホルダ（{{NAME}}）。置換対象は _PLACEHOLDERS に含まれる名前のみ
+_PLACEHOLDER_RE = re.compile(rb"\{\{([A-Z_0-9]+)\}\}")
+_PLACEHOLDERS = frozenset(
+    ("TITLE", "EVALUATION", "MESSAGE", "RESULT_1_SRC", "RESULT_2_SRC", "ERROR_ROWS")
+)
+
+
+# 保存形式ごとの cv2.imwrite パラメータ。PNG は圧縮レベル 1（既定の 3 より高速、サイズは微増）
+_IMWRITE_PARAMS: dict[str, list[int]] = {
+    "png": [cv2.IMWRITE_PNG_COMPRESSION, 1],
+    "jpg": [cv2.IMWRITE_JPEG_QUALITY, 85],
+}
+
+# 保存形式ごとに、再エンコードせずそのままコピーできる元ファイルの拡張子と先頭のシグネチャ
+_COPYABLE_FORMATS: dict[str, tuple[tuple[str, ...], bytes]] = {
+    "png": ((".png",), b"\x89PNG\r\n\x1a\n"),
+    "jpg": ((".jpg", ".jpeg"), b"\xff\xd8\xff"),
+}
+
+
+# {{ERROR_ROWS}} に埋め込むエラー画像1組分の行
+_ERROR_ROW_TEMPLATE = (
+    "        <tr>\n"
+    "          <td><img src=\"{prefix}/error_origin_{i}.{ext}\" alt=\"Error_Origin_{i}\"></td>\n"
+    "          <td><img src=\"{prefix}/error_result_{i}.{ext}\" alt=\"Error_Result_{i}\"></td>\n"
+    "        </tr>"
+)
+
+
 def ensure_result_images_dir(result_images_dir: Path) -> None:
     """出力用画像を保存するディレクトリを作成する。
 
     Args:
         result_images_dir: 作成するディレクトリのパス。親ディレクトリも必要なら作成する。
+            既に存在する場合は何もしない。
     """
+    if result_images_dir.is_dir():
+        return
     result_images_dir.mkdir(parents=True, exist_ok=True)
 
 
@@ -30,67 +79,321 @@ def load_image(path: Path) -> np.ndarray | None:
     Returns:
         読み込み成功時は BGR の ndarray、失敗時またはファイルが存在しない場合は None。
     """
-    if not path.exists():
+    path_str = str(path)
+    # 存在しないファイルを cv2.imread に渡すと OpenCV が警告を出力するため、先に確認する
+    if not os.path.isfile(path_str):
         return None
-    img = cv2.imread(str(path))
-    return img
+    return cv2.imread(path_str)
 
 
-def save_image(img: np.ndarray, save_path: Path) -> None:
-    """画像を PNG で指定パスに保存する。
+def save_image(img: np.ndarray, save_path: Path, fmt: str = "png") -> None:
+    """画像を指定形式で指定パスに保存する。
 
     Args:
         img: BGR 形式の画像（cv2 で読み込んだ ndarray）。
-        save_path: 保存先ファイルパス。
+        save_path: 保存先ファイルパス。エンコード形式は cv2.imwrite と同様に拡張子で決まる。
+        fmt: 書き込みパラメータの種類。"png"（圧縮レベル 1）または "jpg"（品質 85）。
+            save_path の拡張子と合わせること。
+
+    Raises:
+        ValueError: fmt が未対応の形式のとき。
+    """
+    _write_image(img, str(save_path), fmt)
+
+
+def _write_image(img: np.ndarray, save_str: str, fmt: str) -> None:
+    """save_image の本体。保存先を文字列のまま受け取る。"""
+    params = _IMWRITE_PARAMS.get(fmt)
+    if params is None:
+        raise ValueError(f"未対応の画像形式です: {fmt}")
+    _unlink_output(save_str)
+    cv2.imwrite(save_str, img, params)
+
+
+def _unlink_output(save_str: str) -> None:
+    """書き込み前に既存の出力ファイルを削除する。
+
+    前回の出力が元画像へのハードリンク（_link_image）の場合、そのまま上書きすると
+    同じ実体を持つ元画像まで書き換わってしまうため、ディレクトリエントリごと外しておく。
     """
-    cv2.imwrite(str(save_path), img)
+    try:
+        os.remove(save_str)
+    except FileNotFoundError:
+        pass
+
+
+def _link_image(src_path: Path, save_str: str) -> bool:
+    """save_str を src_path へのハードリンクに置き換える。
+
+    Returns:
+        リンクできた場合は True。別ファイルシステム・非対応環境・元画像がない場合などは False。
+    """
+    # 固定名だと中断時に残った一時リンクを再利用してしまうため、毎回一意の名前にする
+    tmp_str = f"{save_str}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.link(src_path, tmp_str)
+    except OSError:
+        return False
+    os.replace(tmp_str, save_str)
+    # src_path と save_str が同一ファイルの場合 os.replace は何もしないため、残ったリンクを消す
+    _unlink_output(tmp_str)
+    return True
+
+
+def export_image(
+    src_path: Path, save_path: Path, fmt: str = "png", *, allow_hardlink: bool = False
+) -> bool:
+    """画像ファイルを指定形式で save_path に書き出す。
+
+    元ファイルが既に fmt と同じ形式（拡張子と先頭のシグネチャで判定）であれば、デコード・
+    エンコードせずにコピー（allow_hardlink が True で同一ファイルシステムの場合はハードリンク）で
+    書き出す。それ以外は load_image で読み込み save_image で保存する。
+
+    コピーする場合はシグネチャしか確認しないため、途中が壊れたファイルもそのまま書き出される。
+    また、アルファチャンネル付きや 16bit の画像も元の形式のまま書き出される
+    （デコードする場合は 8bit の BGR に変換される）。
+
+    Args:
+        src_path: 元画像のファイルパス。
+        save_path: 保存先ファイルパス。拡張子は fmt と合わせること。
+        fmt: 保存形式。"png" または "jpg"（save_image を参照）。
+        allow_hardlink: True の場合、コピーの代わりにハードリンクを作る。出力画像と元画像が実体を
+            共有するため、出力先のファイルを外部から上書きすると元画像も書き換わる点に注意。
+
+    Returns:
+        書き出せた場合は True、元画像が存在しない・読み込めない場合は False。
+    """
+    return _export_image(src_path, str(save_path), fmt, allow_hardlink)
+
+
+def _export_image(
+    src_path: Path, save_str: str, fmt: str, allow_hardlink: bool
+) -> bool:
+    """export_image の本体。保存先を文字列のまま受け取る。"""
+    copyable = _COPYABLE_FORMATS.get(fmt)
+    if copyable is not None and src_path.suffix.lower() in copyable[0]:
+        signature = copyable[1]
+        try:
+            with open(src_path, "rb") as f:
+                head = f.read(len(signature))
+        except OSError:
+            # 存在しない・ディレクトリ・読み取り権限がない場合は読み込めない画像として扱う
+            return False
+        # シグネチャが一致しない（画像でない・中身が別形式）場合はデコードして確かめる
+        if head == signature:
+            if allow_hardlink and _link_image(src_path, save_str):
+                return True
+            # save_str が前回の出力（元画像へのハードリンク）でも元画像を書き換えないよう、
+            # 新規作成した一時ファイルにコピーしてから置き換える
+            fd, tmp_str = tempfile.mkstemp(
+                suffix=".tmp", dir=os.path.dirname(save_str) or None
+            )
+            os.close(fd)
+            try:
+                shutil.copyfile(src_path, tmp_str)
+                os.replace(tmp_str, save_str)
+            except BaseException:
+                _unlink_output(tmp_str)
+                raise
+            return True
+    img = load_image(src_path)
+    if img is None:
+        return False
+    _write_image(img, save_str, fmt)
+    return True
+
+
+def _split_error_pairs(
+    error_pairs: list[tuple[Path, Path]] | None,
+    error_origins: list[Path] | None,
+    error_results: list[Path] | None,
+) -> tuple[list[Path], list[Path]]:
+    """エラー画像の指定を (Error_Origin のリスト, Error_Result のリスト) にそろえる。
+
+    Raises:
+        ValueError: error_pairs と error_origins / error_results を同時に指定したとき、
+            error_origins / error_results の片方だけを指定したとき、または長さが異なるとき。
+    """
+    if error_origins is None and error_results is None:
+        if not error_pairs:
+            return [], []
+        origins, results = map(list, zip(*error_pairs))
+        return origins, results
+    if error_pairs is not None:
+        raise ValueError("error_pairs と error_origins / error_results は同時に指定できません")
+    if error_origins is None or error_results is None:
+        raise ValueError("error_origins と error_results は両方指定してください")
+    if len(error_origins) != len(error_results):
+        raise ValueError(
+            f"error_origins と error_results の長さが異なります: "
+            f"{len(error_origins)} != {len(error_results)}"
+        )
+    return error_origins, error_results
 
 
 def build_error_rows_html(
-    error_pairs: list[tuple[Path, Path]],
+    error_pairs: list[tuple[Path, Path]] | None,
     result_images_dir: Path,
     *,
+    error_origins: list[Path] | None = None,
+    error_results: list[Path] | None = None,
     image_loader: Callable[[tuple[Path, Path]], tuple[np.ndarray, np.ndarray]] | None = None,
+    max_workers: int | None = None,
+    image_format: str = "png",
+    allow_hardlink: bool = False,
 ) -> str:
     """エラー画像のペアからテーブル行の HTML を生成し、画像を result_images_dir に保存する。
 
     Args:
         error_pairs: (Error_Origin 画像パス, Error_Result 画像パス) のリスト。
-        result_images_dir: 画像の保存先ディレクトリ。ファイル名は error_origin_0.png 等になる。
-        image_loader: 省略時は load_image で読み込む。(origin_path, result_path) を受け取り
+            error_origins / error_results を使う場合は None。
+        result_images_dir: 画像の保存先ディレクトリ。ファイル名は error_origin_0.png 等になる
+            （拡張子は image_format に従う）。
+        error_origins: Error_Origin 画像パスのリスト。error_results と同じ長さで、
+            error_pairs の代わりに指定できる（ペアのタプルを作らずに済む）。
+        error_results: Error_Result 画像パスのリスト。
+        image_loader: 省略時は export_image でファイルから書き出す（同じ形式ならコピーのみ）。
+            (origin_path, result_path) を受け取り
             (origin_img, result_img) を返す callable を渡すと、ファイルがなくてもメモリ上の画像で生成可能。
-            読み込み失敗時は ValueError を送出すること。
+            読み込み失敗時は ValueError を送出すること。max_workers を 2 以上にした場合のみ
+            複数スレッドから同時に呼ばれる。
+        max_workers: 画像の読み込み・保存を並列に行うスレッド数。省略時は image_loader を
+            指定した場合 1（呼び出し元のスレッドで順に処理）、それ以外は min(8, CPU 数)。
+        image_format: 保存形式。"png" または "jpg"（save_image を参照）。
+        allow_hardlink: export_image に渡す。True の場合はコピーの代わりにハードリンクを作る。
 
     Returns:
         テンプレートの {{ERROR_ROWS}} に埋め込む HTML 文字列（<tr> 行の連結、または「なし」の1行）。
+
+    Raises:
+        ValueError: 画像を読み込めないとき、またはエラー画像の指定が不正なとき（_split_error_pairs を参照）。
     """
-    def default_loader(pair: tuple[Path, Path]) -> tuple[np.ndarray, np.ndarray]:
-        o = load_image(pair[0])
-        r = load_image(pair[1])
-        if o is None:
-            raise ValueError(f"画像を読み込めません: {pair[0]}")
-        if r is None:
-            raise ValueError(f"画像を読み込めません: {pair[1]}")
-        return (o, r)
-
-    loader = image_loader or default_loader
-    prefix = result_images_dir.name
-    rows = []
-    for i, (origin_path, result_path) in enumerate(error_pairs):
-        origin_save = result_images_dir / f"error_origin_{i}.png"
-        result_save = result_images_dir / f"error_result_{i}.png"
-        origin_img, result_img = loader((origin_path, result_path))
-        save_image(origin_img, origin_save)
-        save_image(result_img, result_save)
-        rel_origin = f"{prefix}/{origin_save.name}"
-        rel_result = f"{prefix}/{result_save.name}"
-        rows.append(
-            f"        <tr>\n"
-            f"          <td><img src=\"{rel_origin}\" alt=\"Error_Origin_{i}\"></td>\n"
-            f"          <td><img src=\"{rel_result}\" alt=\"Error_Result_{i}\"></td>\n"
-            f"        </tr>"
-        )
-    return "\n".join(rows) if rows else "        <tr><td colspan=\"2\">なし</td></tr>"
+    origins, results = _split_error_pairs(error_pairs, error_origins, error_results)
+    idx_strs = list(map(str, range(len(origins))))
+    ext = image_format
+    # 保存先は Path を組み立てず文字列で扱う（ファイル名は ext 込みで確定しているため）
+    dir_str = str(result_images_dir)
+    sep = os.sep
+
+    def process(idx: str, origin_path: Path, result_path: Path) -> None:
+        origin_save = f"{dir_str}{sep}error_origin_{idx}.{ext}"
+        result_save = f"{dir_str}{sep}error_result_{idx}.{ext}"
+        if image_loader is None:
+            for src, dst in ((origin_path, origin_save), (result_path, result_save)):
+                if not _export_image(src, dst, ext, allow_hardlink):
+                    raise ValueError(f"画像を読み込めません: {src}")
+            return
+        origin_img, result_img = image_loader((origin_path, result_path))
+        _write_image(origin_img, origin_save, ext)
+        _write_image(result_img, result_save, ext)
+
+    # cv2.imread / imwrite は GIL を解放するため、ペアごとの I/O をスレッドで重ねる
+    # image_loader はスレッドセーフとは限らないため、明示的に指定された場合のみ並列に呼ぶ
+    if max_workers is None:
+        max_workers = 1 if image_loader is not None else min(8, os.cpu_count() or 2)
+    if max_workers <= 1 or len(origins) <= 1:
+        for idx, origin_path, result_path in zip(idx_strs, origins, results):
+            process(idx, origin_path, result_path)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 例外（読み込み失敗の ValueError 等）は結果を取り出す際に再送出される
+            for _ in executor.map(process, idx_strs, origins, results):
+                pass
+
+    if not idx_strs:
+        return "        <tr><td colspan=\"2\">なし</td></tr>"
+    prefix = _esc(result_images_dir.name, quote=True)
+    row_fmt = _ERROR_ROW_TEMPLATE.format
+    return "\n".join([row_fmt(prefix=prefix, i=idx, ext=ext) for idx in idx_strs])
+
+
+def _parse_template(
+    template_data: bytes,
+) -> tuple[list[bytes | tuple[str]], frozenset[str]]:
+    """テンプレートをリテラル部分とプレースホルダの列に分割する。
+
+    デコードせず UTF-8 のバイト列のまま扱う。改行は os.linesep に揃える（置換値も同様に揃え、
+    出力の改行を統一する）。_PLACEHOLDERS にない名前の {{NAME}} は置換せずリテラルとして残す。
+
+    Args:
+        template_data: テンプレート HTML のバイト列（UTF-8）。
+
+    Returns:
+        (segments, present) のタプル。segments はリテラル部分を bytes、プレースホルダを
+        (名前,) のタプルとして並べたリスト。present はテンプレートに現れるプレースホルダ名の集合。
+    """
+    template_data = re.sub(rb"\r\n?", b"\n", template_data)
+    if os.linesep != "\n":
+        template_data = template_data.replace(b"\n", os.linesep.encode("ascii"))
+    segments: list[bytes | tuple[str]] = []
+    present: set[str] = set()
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(template_data):
+        name = m.group(1).decode("ascii")
+        if name not in _PLACEHOLDERS:
+            continue
+        segments.append(template_data[pos:m.start()])
+        segments.append((name,))
+        present.add(name)
+        pos = m.end()
+    segments.append(template_data[pos:])
+    return segments, frozenset(present)
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    """ファイルの更新を検知するためのキー (更新時刻 ns, サイズ) を返す。"""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_and_parse_template(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[list[bytes | tuple[str]], frozenset[str]]:
+    """テンプレートを読み込んで分割する。
+
+    mtime_ns / size はキャッシュのキーとしてのみ使う。ファイルが更新されるとキーが変わり、
+    自動的に読み直される。
+    """
+    return _parse_template(Path(path_str).read_bytes())
+
+
+def _load_template(
+    template_path: Path,
+) -> tuple[list[bytes | tuple[str]], frozenset[str]]:
+    """テンプレートを読み込んで分割する。ファイルが変わらない限りキャッシュを返す。
+
+    Args:
+        template_path: テンプレート HTML のパス。
+
+    Returns:
+        _parse_template の戻り値。
+    """
+    return _read_and_parse_template(str(template_path), *_stat_key(template_path))
+
+
+@contextmanager
+def _cv_num_threads(num_threads: int | None) -> Iterator[None]:
+    """with ブロック内だけ OpenCV のスレッド数を num_threads にする。None の場合は変更しない。"""
+    if num_threads is None:
+        yield
+        return
+    prev = cv2.getNumThreads()
+    cv2.setNumThreads(num_threads)
+    try:
+        yield
+    finally:
+        cv2.setNumThreads(prev)
+
+
+def _has_display() -> bool:
+    """ブラウザを開ける環境かどうかを返す。CI 環境や、Linux 等でディスプレイがない場合は False。"""
+    # CI=false / CI=0 のように明示的に無効化されている場合は CI 環境とみなさない
+    if os.environ.get("CI", "").strip().lower() not in ("", "0", "false", "no", "off"):
+        return False
+    if sys.platform.startswith(("win", "darwin")):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
 
 
 def generate_report(
@@ -99,63 +402,118 @@ def generate_report(
     message: str,
     result_1_path: Path,
     result_2_path: Path | None,
-    error_pairs: list[tuple[Path, Path]],
+    error_pairs: list[tuple[Path, Path]] | None,
     output_html_path: Path,
     template_path: Path,
     result_images_dir: Path,
     *,
-    open_browser: bool = True,
+    error_origins: list[Path] | None = None,
+    error_results: list[Path] | None = None,
+    open_browser: bool | None = None,
     image_loader: Callable[[tuple[Path, Path]], tuple[np.ndarray, np.ndarray]] | None = None,
+    max_workers: int | None = None,
+    image_format: str = "png",
+    allow_hardlink: bool = False,
+    cv_num_threads: int | None = None,
+    verbose: bool = True,
 ) -> None:
     """テンプレートを読み込み、画像を保存してプレースホルダを置換し、レポート用 HTML を出力する。
 
+    テンプレートは初回読み込み時にプレースホルダ位置で分割してキャッシュし、
+    2回目以降は（ファイルが更新されていなければ）再読み込みしない。出力はリテラル部分（UTF-8 の
+    バイト列）と置換値を bytearray に連結して1回で書き出すため、HTML 全体の再エンコードは行わない。
+
     他プロジェクトに埋め込む場合は、template_path / output_html_path / result_images_dir
     を任意のパスで指定する。output_html_path と result_images_dir は同じ親ディレクトリに置くことを推奨。
 
     Args:
-        title: レポートのタイトル（{{TITLE}} に埋め込まれる）。
-        evaluation: 評価値のテキスト（{{EVALUATION}}）。
-        message: メッセージ文（{{MESSAGE}}）。
-        result_1_path: 結果画像のファイルパス。result_images_dir に result_1.png としてコピーされる。
+        title: レポートのタイトル（{{TITLE}} に埋め込まれる）。HTML エスケープされる。
+        evaluation: 評価値のテキスト（{{EVALUATION}}）。HTML エスケープされる。
+        message: メッセージ文（{{MESSAGE}}）。HTML エスケープされる（改行はそのまま表示される）。
+        result_1_path: 結果画像のファイルパス。result_images_dir に result_1.png としてコピーされる
+            （形式が異なる場合は変換して保存）。
         result_2_path: 結果グラフのファイルパス。None の場合は保存をスキップ（事前に result_2.png を置いている想定）。
+            None の場合、{{RESULT_2_SRC}} は image_format によらず result_2.png を指す。
         error_pairs: (Error_Origin 画像パス, Error_Result 画像パス) のリスト。
+            error_origins / error_results を使う場合は None。
         output_html_path: 出力する HTML ファイルのパス。
         template_path: テンプレート HTML のパス。
         result_images_dir: 画像を保存するディレクトリ（HTML 内では result_images/xxx として参照される）。
-        open_browser: True の場合、出力後に既定ブラウザで HTML を開く。
-        image_loader: エラー画像用のカスタムローダー。未指定時は load_image でファイルから読み込む。
+        error_origins: Error_Origin 画像パスのリスト。error_pairs の代わりに error_results と
+            組で指定できる（同じ長さであること）。
+        error_results: Error_Result 画像パスのリスト。
+        open_browser: True の場合、出力後に既定ブラウザで HTML を開く（別スレッドで起動し、完了を待たない）。
+            None（既定）の場合、CI 環境やディスプレイのない環境では開かず、それ以外では開く。
+        image_loader: エラー画像用のカスタムローダー。未指定時は export_image でファイルから書き出す（同じ形式ならコピーのみ）。
+        max_workers: エラー画像の読み込み・保存に使うスレッド数。未指定時は image_loader を指定した場合 1、
+            それ以外は min(8, CPU 数)。image_loader を並列に呼んでよい場合のみ 2 以上を指定する。
+        image_format: 保存する画像の形式。"png"（既定）または "jpg"。"jpg" の場合、
+            テンプレートは結果画像を {{RESULT_1_SRC}} / {{RESULT_2_SRC}} で参照している必要がある。
+        allow_hardlink: True の場合、元画像と同じ形式なら result_images_dir にコピーの代わりに
+            ハードリンクを作る（export_image を参照）。
+        cv_num_threads: 画像の書き出し中だけ cv2.setNumThreads で設定する OpenCV のスレッド数
+            （終了後は元に戻す）。None の場合は変更しない。max_workers と併用する場合は、
+            両者の積が CPU 数程度になるようにすると過剰なスレッド生成を避けられる。
+        verbose: True の場合、出力先をモジュールのロガー（logging.getLogger("report") 等）に
+            INFO で記録する。表示するには呼び出し側で logging を設定すること。
 
     Raises:
         ValueError: result_1_path または result_2_path（None でない場合）の画像を読み込めないとき。
+            エラー画像を読み込めないとき、またはエラー画像の指定が不正なとき。
     """
     ensure_result_images_dir(result_images_dir)
 
-    result_1_img = load_image(result_1_path)
-    if result_1_img is None:
-        raise ValueError(f"結果画像を読み込めません: {result_1_path}")
-    save_image(result_1_img, result_images_dir / "result_1.png")
+    with _cv_num_threads(cv_num_threads):
+        if not export_image(
+            result_1_path, result_images_dir / f"result_1.{image_format}", image_format,
+            allow_hardlink=allow_hardlink,
+        ):
+            raise ValueError(f"結果画像を読み込めません: {result_1_path}")
 
-    if result_2_path is not None:
-        result_2_img = load_image(result_2_path)
-        if result_2_img is None:
+        if result_2_path is not None and not export_image(
+            result_2_path, result_images_dir / f"result_2.{image_format}", image_format,
+            allow_hardlink=allow_hardlink,
+        ):
             raise ValueError(f"結果グラフを読み込めません: {result_2_path}")
-        save_image(result_2_img, result_images_dir / "result_2.png")
 
-    error_rows_html = build_error_rows_html(
-        error_pairs, result_images_dir, image_loader=image_loader
-    )
+        error_rows_html = build_error_rows_html(
+            error_pairs, result_images_dir,
+            error_origins=error_origins, error_results=error_results,
+            image_loader=image_loader, max_workers=max_workers,
+            image_format=image_format, allow_hardlink=allow_hardlink,
+        )
 
-    template_text = template_path.read_text(encoding="utf-8")
-    html = (
-        template_text
-        .replace("{{TITLE}}", title)
-        .replace("{{EVALUATION}}", evaluation)
-        .replace("{{MESSAGE}}", message)
-        .replace("{{ERROR_ROWS}}", error_rows_html)
-    )
+    segments, present = _load_template(template_path)
+    result_2_ext = "png" if result_2_path is None else image_format
+    prefix = result_images_dir.name
+    # 利用者が渡した文字列は HTML エスケープする。ERROR_ROWS は本モジュールで生成済みのためそのまま
+    values = {
+        name: value
+        for name, value in (
+            ("TITLE", _esc(title, quote=True)),
+            ("EVALUATION", _esc(evaluation, quote=True)),
+            ("MESSAGE", _esc(message, quote=True)),
+            ("RESULT_1_SRC", _esc(f"{prefix}/result_1.{image_format}", quote=True)),
+            ("RESULT_2_SRC", _esc(f"{prefix}/result_2.{result_2_ext}", quote=True)),
+            ("ERROR_ROWS", error_rows_html),
+        )
+        if name in present
+    }
+    if os.linesep != "\n":
+        values = {name: value.replace("\n", os.linesep) for name, value in values.items()}
+    encoded = {name: value.encode("utf-8") for name, value in values.items()}
 
-    output_html_path.write_text(html, encoding="utf-8")
-    print(f"出力: {output_html_path}")
+    # テンプレートのリテラル部分は UTF-8 のまま連結し、エンコードは置換値に対してのみ行う
+    html = bytearray()
+    for seg in segments:
+        html += seg if isinstance(seg, bytes) else encoded[seg[0]]
+    output_html_path.write_bytes(html)
+    if verbose:
+        _log.info("出力: %s", output_html_path)
 
+    if open_browser is None:
+        open_browser = _has_display()
     if open_browser:
-        webbrowser.open(f"file://{output_html_path.resolve().as_posix()}")
+        # resolve() はシンボリックリンク解決のため各親ディレクトリを stat するので abspath で済ませる
+        url = "file://" + os.path.abspath(output_html_path).replace("\\", "/")
+        threading.Thread(target=webbrowser.open, args=(url,)).start()
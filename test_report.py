@@ -4,12 +4,12 @@
 レポート生成機能は report モジュールにあり、本ファイルは
 ダミー画像・偽ヒストグラムの作成と report.generate_report の呼び出しのみ行う。
 """
+import logging
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 import cv2
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 import numpy as np
 
 from report import generate_report, ensure_result_images_dir
@@ -23,87 +23,89 @@ RESULT_IMAGES_DIR = SCRIPT_DIR / "result_images"
 IMAGE_DIR = SCRIPT_DIR / "image"
 
 
-def load_or_create_image(path: Path, fallback_name: str) -> np.ndarray:
+def existing_or_dummy_path(path: Path, fallback_name: str, dummy_dir: Path) -> Path:
     """
-    画像を cv2 で読み込む。存在しない場合はテスト用のダミー画像を生成する。
+    path が存在すればそのまま返す。存在しない場合はテスト用のダミー画像の PNG パスを返す。
     （report モジュールには含めず、テスト・ダミー用のみ）
+    ダミーは fallback_name ごとに一度だけエンコードして dummy_dir に書き出し、以降は同じファイルを返す。
+    report 側はこのファイルを再エンコードせずにコピーする。
     """
-    if path.exists():
-        img = cv2.imread(str(path))
-        if img is not None:
-            return img
+    if path.is_file():
+        return path
+    dummy_path = dummy_dir / f"{fallback_name}.png"
+    if not dummy_path.exists():
+        ok, buf = cv2.imencode(".png", _dummy_image(fallback_name), [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            raise RuntimeError(f"ダミー画像のエンコードに失敗しました: {fallback_name}")
+        dummy_path.write_bytes(buf.tobytes())
+    return dummy_path
+
+
+@lru_cache(maxsize=32)
+def _dummy_image(name: str) -> np.ndarray:
+    """name を描画したダミー画像を生成する。同じ name では同じ読み取り専用の配列を返す。"""
     h, w = 200, 300
     img = np.full((h, w, 3), 220, dtype=np.uint8)
     cv2.rectangle(img, (10, 10), (w - 10, h - 10), (180, 180, 180), 2)
     cv2.putText(
-        img, fallback_name, (20, 100),
+        img, name, (20, 100),
         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (100, 100, 100), 2,
     )
+    # 共有する配列のため、書き換えようとしたら例外になるようにしておく
+    img.setflags(write=False)
     return img
 
 
 def create_fake_histogram(save_path: Path) -> None:
-    """matplotlib で偽のヒストグラムを作成し、指定パスに保存する。"""
-    np.random.seed(42)
-    data = np.random.normal(100, 15, 200)
-    fig, ax = plt.subplots(figsize=(5, 3.5), dpi=120)
-    ax.hist(data, bins=25, color="steelblue", edgecolor="white", linewidth=0.5)
-    ax.set_xlabel("値")
-    ax.set_ylabel("度数")
-    ax.set_title("結果グラフ（ヒストグラム）")
-    fig.tight_layout()
-    fig.savefig(save_path, bbox_inches="tight")
-    plt.close(fig)
+    """NumPy で集計し OpenCV で棒を描いた偽のヒストグラムを作成し、指定パスに保存する。"""
+    rng = np.random.default_rng(42)
+    data = rng.normal(100, 15, 200)
+    counts, _ = np.histogram(data, bins=25)
+    h, w, margin = 360, 600, 20
+    img = np.full((h, w, 3), 255, dtype=np.uint8)
+    max_count = int(counts.max())
+    bar_w = (w - 2 * margin) // len(counts)
+    base_y = h - margin
+    for i, c in enumerate(counts):
+        x0 = margin + i * bar_w
+        top_y = base_y - int(c / max_count * (h - 2 * margin))
+        cv2.rectangle(img, (x0, top_y), (x0 + bar_w - 2, base_y), (180, 130, 70), -1)
+    cv2.line(img, (margin, base_y), (w - margin, base_y), (80, 80, 80), 1)
+    cv2.imwrite(str(save_path), img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
 
 
 def run_test_data_1() -> None:
     """
     テストデータ1:
-    - 結果グラフ: matplotlib で偽ヒストグラムを生成
+    - 結果グラフ: NumPy + OpenCV で偽ヒストグラムを生成
     - 結果画像・エラー画像: image フォルダがあれば使用、なければダミー
     """
-    from report import load_image, save_image
-
     ensure_result_images_dir(RESULT_IMAGES_DIR)
     create_fake_histogram(RESULT_IMAGES_DIR / "result_2.png")
 
-    result_1_path = IMAGE_DIR / "result_1.png"
-    if load_image(result_1_path) is None:
-        save_image(
-            load_or_create_image(result_1_path, "result_1"),
-            RESULT_IMAGES_DIR / "result_1.png",
-        )
-        result_1_path = RESULT_IMAGES_DIR / "result_1.png"
-
-    error_pairs = [
-        (IMAGE_DIR / "error_origin_0.png", IMAGE_DIR / "error_result_0.png"),
-        (IMAGE_DIR / "error_origin_1.png", IMAGE_DIR / "error_result_1.png"),
-        (IMAGE_DIR / "error_origin_2.png", IMAGE_DIR / "error_result_2.png"),
-        (IMAGE_DIR / "error_origin_3.png", IMAGE_DIR / "error_result_3.png"),
-        (IMAGE_DIR / "error_origin_4.png", IMAGE_DIR / "error_result_4.png"),
-    ]
-
-    def dummy_image_loader(pair: tuple[Path, Path]) -> tuple[np.ndarray, np.ndarray]:
-        a, b = pair
-        return (
-            load_or_create_image(a, "Error_Origin"),
-            load_or_create_image(b, "Error_Result"),
+    with tempfile.TemporaryDirectory() as tmp:
+        dummy_dir = Path(tmp)
+        error_pairs = [
+            (
+                existing_or_dummy_path(IMAGE_DIR / f"error_origin_{i}.png", "Error_Origin", dummy_dir),
+                existing_or_dummy_path(IMAGE_DIR / f"error_result_{i}.png", "Error_Result", dummy_dir),
+            )
+            for i in range(5)
+        ]
+
+        generate_report(
+            title="出力結果",
+            evaluation="0.75",
+            message="エラー画像が5ファイル検出されました",
+            result_1_path=existing_or_dummy_path(IMAGE_DIR / "result_1.png", "result_1", dummy_dir),
+            result_2_path=None,
+            error_pairs=error_pairs,
+            output_html_path=OUTPUT_HTML,
+            template_path=TEMPLATE_PATH,
+            result_images_dir=RESULT_IMAGES_DIR,
         )
 
-    generate_report(
-        title="出力結果",
-        evaluation="0.75",
-        message="エラー画像が5ファイル検出されました",
-        result_1_path=result_1_path,
-        result_2_path=None,
-        error_pairs=error_pairs,
-        output_html_path=OUTPUT_HTML,
-        template_path=TEMPLATE_PATH,
-        result_images_dir=RESULT_IMAGES_DIR,
-        open_browser=True,
-        image_loader=dummy_image_loader,
-    )
-
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     run_test_data_1()